@@ -1,97 +1,246 @@
-from datetime import datetime, timedelta
-import pickle
-from abc import ABC, abstractmethod
-
-class Field:
-    def __init__(self, value):
-        self.value = value
-
-    def __str__(self):
-        return str(self.value)
-
-class Name(Field):
-    def __init__(self, value):
-        if not value.strip() or not value.replace(" ", "").isalpha():
-            raise ValueError("Name must contain only letters and cannot be empty.")
-        super().__init__(value)
+from datetime import date, datetime
+import gc
+import msgspec
+import os
+import re
+
+_NAME_RE = re.compile(r"^(?=.*\S)[A-Za-z ]+$")
+_DIGITS = b"0123456789"
+_DATE_FMT = "%d.%m.%Y"
+
+def _validate_name(value):
+    if not _NAME_RE.match(value):
+        raise ValueError("Name must contain only letters and cannot be empty.")
+    return value
+
+def _validate_phone(value):
+    try:
+        digits = value.encode("ascii")
+    except UnicodeEncodeError:
+        raise ValueError("Phone number must contain 10 digits.")
+    if len(digits) != 10 or digits.translate(None, _DIGITS):
+        raise ValueError("Phone number must contain 10 digits.")
+    return value
 
-class Phone(Field):
-    def __init__(self, value):
-        if not value.isdigit() or len(value) != 10:
-            raise ValueError("Phone number must contain 10 digits.")
-        super().__init__(value)
+class Birthday:
+    __slots__ = ("value", "md", "formatted")
 
-class Birthday(Field):
     def __init__(self, value):
         try:
-            self.value = datetime.strptime(value, "%d.%m.%Y").date()
+            self.value = datetime.strptime(value, _DATE_FMT).date()
         except ValueError:
             raise ValueError("Invalid date format. Use DD.MM.YYYY")
+        self.md = (self.value.month, self.value.day)
+        self.formatted = self.value.strftime(_DATE_FMT)
+
+    @classmethod
+    def _unchecked(cls, value):
+        self = cls.__new__(cls)
+        self.value = value
+        self.md = (value.month, value.day)
+        self.formatted = value.strftime(_DATE_FMT)
+        return self
+
+    def __str__(self):
+        return str(self.value)
 
 class Record:
+    __slots__ = ("name", "phones", "birthday")
+
     def __init__(self, name):
-        self.name = Name(name)
-        self.phones = []
+        self.name = _validate_name(name)
+        self.phones = {}
+        self.birthday = None
+
+    @classmethod
+    def _unchecked(cls, name):
+        self = cls.__new__(cls)
+        self.name = name
+        self.phones = {}
         self.birthday = None
+        return self
 
     def add_phone(self, phone):
-        self.phones.append(Phone(phone))
+        self.phones[_validate_phone(phone)] = None
 
     def remove_phone(self, phone):
-        self.phones = [p for p in self.phones if p.value != phone]
+        self.phones.pop(phone, None)
 
     def edit_phone(self, old_phone, new_phone):
-        for p in self.phones:
-            if p.value == old_phone:
-                p.value = Phone(new_phone).value
+        if old_phone in self.phones:
+            _validate_phone(new_phone)
+            del self.phones[old_phone]
+            self.phones[new_phone] = None
 
     def add_birthday(self, birthday):
         self.birthday = Birthday(birthday)
 
     def find_phone(self, phone):
-        for p in self.phones:
-            if p.value == phone:
-                return p
+        return phone if phone in self.phones else None
 
     def __str__(self):
-        phones_str = "; ".join(str(p) for p in self.phones)
+        phones_str = "; ".join(self.phones)
         birthday_str = f", birthday: {self.birthday}" if self.birthday else ""
         return f"Contact name: {self.name}, phones: {phones_str}{birthday_str}"
 
 class AddressBook:
+    __slots__ = ("data", "_pending", "_with_birthday", "_bday_cache_key", "_bday_cache")
+
     def __init__(self):
         self.data = {}
+        self._pending = {}
+        self._with_birthday = {}
+        self._bday_cache_key = None
+        self._bday_cache = []
 
     def add_record(self, record):
-        self.data[record.name.value] = record
+        key = record.name.casefold()
+        self._pending.pop(key, None)
+        self.data[key] = record
+        if record.birthday:
+            self._with_birthday[key] = record
+            self._bday_cache_key = None
+
+    def _inflate(self, key):
+        name, schema = self._pending.pop(key)
+        record = Record._unchecked(name)
+        for phone in schema.phones:
+            record.phones[phone] = None
+        if schema.birthday:
+            record.birthday = Birthday._unchecked(_parse_trusted_date(schema.birthday))
+        self.add_record(record)
+        return record
+
+    def _inflate_all(self):
+        for key in list(self._pending):
+            self._inflate(key)
+
+    def all_records(self):
+        self._inflate_all()
+        return self.data
 
     def find(self, name):
-        return self.data.get(name)
+        key = name.casefold()
+        if key in self._pending:
+            return self._inflate(key)
+        return self.data.get(key)
+
+    def set_birthday(self, name, birthday):
+        record = self.find(name)
+        if record is None:
+            return None
+        record.add_birthday(birthday)
+        self._with_birthday[name.casefold()] = record
+        self._bday_cache_key = None
+        return record
 
     def delete(self, name):
-        if name in self.data:
-            del self.data[name]
+        key = name.casefold()
+        if self._pending.pop(key, None) is not None:
+            return
+        if key in self.data:
+            del self.data[key]
+            self._with_birthday.pop(key, None)
+            self._bday_cache_key = None
+
+    def __reduce__(self):
+        self._inflate_all()
+        names = []
+        phones = []
+        birthdays = []
+        for record in self.data.values():
+            names.append(record.name)
+            phones.append(list(record.phones))
+            birthdays.append(record.birthday.formatted if record.birthday else None)
+        return (AddressBook._from_soa, (names, phones, birthdays))
+
+    @classmethod
+    def _from_soa(cls, names, phones, birthdays):
+        book = cls()
+        for name, phone_list, birthday in zip(names, phones, birthdays):
+            record = Record._unchecked(name)
+            for phone in phone_list:
+                record.phones[phone] = None
+            if birthday:
+                record.birthday = Birthday._unchecked(_parse_trusted_date(birthday))
+            book.add_record(record)
+        return book
 
     def get_upcoming_birthdays(self, days=7):
-        today = datetime.today().date()
+        if self._pending:
+            self._inflate_all()
+        today = date.today()
+        today_ord = today.toordinal()
+        if self._bday_cache_key == (today_ord, days):
+            return self._bday_cache
+        end_ord = today_ord + days
+        year = today.year
         upcoming_birthdays = []
-        for record in self.data.values():
-            if record.birthday:
-                birthday_this_year = record.birthday.value.replace(year=today.year)
-                if today <= birthday_this_year <= today + timedelta(days=days):
-                    upcoming_birthdays.append(record)
+        for record in self._with_birthday.values():
+            month, day = record.birthday.md
+            try:
+                birthday_ord = date(year, month, day).toordinal()
+            except ValueError:  # Feb 29 on a non-leap year
+                birthday_ord = date(year, 3, 1).toordinal()
+            if birthday_ord < today_ord:
+                try:
+                    birthday_ord = date(year + 1, month, day).toordinal()
+                except ValueError:
+                    birthday_ord = date(year + 1, 3, 1).toordinal()
+            if birthday_ord <= end_ord:
+                upcoming_birthdays.append(record)
+        self._bday_cache_key = (today_ord, days)
+        self._bday_cache = upcoming_birthdays
         return upcoming_birthdays
 
-def save_data(book, filename="addressbook.pkl"):
-    with open(filename, "wb") as f:
-        pickle.dump(book, f)
+class RecordSchema(msgspec.Struct):
+    phones: list[str]
+    birthday: str | None
+
+def _parse_trusted_date(value):
+    day, month, year = value.split(".")
+    return date(int(year), int(month), int(day))
+
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder(dict[str, RecordSchema])
+_encode_buf = bytearray(64 * 1024)
+
+def _no_gc(func):
+    def wrapper(*args, **kwargs):
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if enabled:
+                gc.enable()
+    return wrapper
 
-def load_data(filename="addressbook.pkl"):
+@_no_gc
+def save_data(book, filename="addressbook.msgpack"):
+    payload = {}
+    for record in book.data.values():
+        birthday = record.birthday.formatted if record.birthday else None
+        payload[record.name] = RecordSchema(phones=list(record.phones), birthday=birthday)
+    for name, schema in book._pending.values():
+        payload[name] = schema
+    _encoder.encode_into(payload, _encode_buf)
+    tmp = filename + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_encode_buf)
+    os.replace(tmp, filename)
+
+@_no_gc
+def load_data(filename="addressbook.msgpack"):
     try:
         with open(filename, "rb") as f:
-            return pickle.load(f)
+            buf = f.read()
     except FileNotFoundError:
         return AddressBook()
+    book = AddressBook()
+    for name, schema in _decoder.decode(buf).items():
+        book._pending[name.casefold()] = (name, schema)
+    return book
 
 def input_error(func):
     def wrapper(*args, **kwargs):
@@ -122,9 +271,7 @@ def add_birthday(args, book):
     if len(args) < 2:
         return "Please provide a name and a birthday."
     name, birthday, *_ = args
-    record = book.find(name)
-    if record:
-        record.add_birthday(birthday)
+    if book.set_birthday(name, birthday):
         return f"Birthday added to contact {name}."
     return "Contact not found."
 
@@ -135,7 +282,7 @@ def show_birthday(args, book):
     name, *_ = args
     record = book.find(name)
     if record and record.birthday:
-        return f"{name}'s birthday is {record.birthday.value.strftime('%d.%m.%Y')}."
+        return f"{name}'s birthday is {record.birthday.formatted}."
     return "Contact not found or birthday not set."
 
 @input_error
@@ -143,41 +290,37 @@ def birthdays(args, book):
     upcoming_birthdays = book.get_upcoming_birthdays()
     if not upcoming_birthdays:
         return "No birthdays in the next week."
-    result = "Upcoming birthdays:\n"
+    lines = ["Upcoming birthdays:"]
     for record in upcoming_birthdays:
-        result += f"{record.name}: {record.birthday.value.strftime('%d.%m.%Y')}\n"
-    return result
+        lines.append(f"{record.name}: {record.birthday.formatted}")
+    return "\n".join(lines) + "\n"
 
 def parse_input(user_input):
-    parts = user_input.split()
+    # No command takes more than two arguments, so cap the split and
+    # leave any pasted excess in the final token instead of tokenizing it.
+    parts = user_input.split(None, 3)
     command = parts[0].lower() if parts else ""
     args = parts[1:]
     return command, args
 
-class UserInterface(ABC):
-    @abstractmethod
+class UserInterface:
     def display_message(self, message):
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def display_contact(self, record):
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def display_all_contacts(self, records):
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def display_upcoming_birthdays(self, records):
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_user_input(self, prompt):
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def show_available_commands(self):
-        pass
+        raise NotImplementedError
 
 class ConsoleInterface(UserInterface):
     def display_message(self, message):
@@ -196,7 +339,7 @@ class ConsoleInterface(UserInterface):
         else:
             print("Upcoming birthdays:")
             for record in records:
-                print(f"{record.name}: {record.birthday.value.strftime('%d.%m.%Y')}")
+                print(f"{record.name}: {record.birthday.formatted}")
 
     def get_user_input(self, prompt):
         return input(prompt)
@@ -213,6 +356,63 @@ class ConsoleInterface(UserInterface):
         print("birthdays - Show upcoming birthdays in the next week")
         print("close or exit - Exit the program")
 
+def _handle_hello(args, book, ui):
+    ui.display_message("How can I help you?")
+
+def _handle_add(args, book, ui):
+    ui.display_message(add_contact(args, book))
+
+def _handle_change(args, book, ui):
+    if len(args) < 2:
+        ui.display_message("Please provide a name and a new phone number.")
+        return
+    name, new_phone, *_ = args
+    record = book.find(name)
+    if record:
+        try:
+            record.edit_phone(next(iter(record.phones)), new_phone)
+            ui.display_message(f"Phone number for {name} updated.")
+        except ValueError as e:
+            ui.display_message(str(e))
+    else:
+        ui.display_message("Contact not found.")
+
+def _handle_phone(args, book, ui):
+    if len(args) < 1:
+        ui.display_message("Please provide a name.")
+        return
+    name, *_ = args
+    record = book.find(name)
+    if record:
+        ui.display_message(f"{name}'s phone number(s): {', '.join(record.phones)}")
+    else:
+        ui.display_message("Contact not found.")
+
+def _handle_all(args, book, ui):
+    ui.display_all_contacts(book.all_records())
+
+def _handle_add_birthday(args, book, ui):
+    ui.display_message(add_birthday(args, book))
+
+def _handle_show_birthday(args, book, ui):
+    ui.display_message(show_birthday(args, book))
+
+def _handle_birthdays(args, book, ui):
+    ui.display_upcoming_birthdays(book.get_upcoming_birthdays())
+
+_EXIT_CMDS = frozenset({"close", "exit"})
+
+COMMANDS = {
+    "hello": _handle_hello,
+    "add": _handle_add,
+    "change": _handle_change,
+    "phone": _handle_phone,
+    "all": _handle_all,
+    "add-birthday": _handle_add_birthday,
+    "show-birthday": _handle_show_birthday,
+    "birthdays": _handle_birthdays,
+}
+
 def main():
     book = load_data()
     ui = ConsoleInterface()
@@ -225,55 +425,14 @@ def main():
             continue
         command, args = parse_input(user_input)
 
-        if command in ["close", "exit"]:
+        if command in _EXIT_CMDS:
             ui.display_message("Good bye!")
             save_data(book)
             break
 
-        elif command == "hello":
-            ui.display_message("How can I help you?")
-
-        elif command == "add":
-            ui.display_message(add_contact(args, book))
-
-        elif command == "change":
-            if len(args) < 2:
-                ui.display_message("Please provide a name and a new phone number.")
-                continue
-            name, new_phone, *_ = args
-            record = book.find(name)
-            if record:
-                try:
-                    record.edit_phone(record.phones[0].value, new_phone)
-                    ui.display_message(f"Phone number for {name} updated.")
-                except ValueError as e:
-                    ui.display_message(str(e))
-            else:
-                ui.display_message("Contact not found.")
-
-        elif command == "phone":
-            if len(args) < 1:
-                ui.display_message("Please provide a name.")
-                continue
-            name, *_ = args
-            record = book.find(name)
-            if record:
-                ui.display_message(f"{name}'s phone number(s): {', '.join(phone.value for phone in record.phones)}")
-            else:
-                ui.display_message("Contact not found.")
-
-        elif command == "all":
-            ui.display_all_contacts(book.data)
-
-        elif command == "add-birthday":
-            ui.display_message(add_birthday(args, book))
-
-        elif command == "show-birthday":
-            ui.display_message(show_birthday(args, book))
-
-        elif command == "birthdays":
-            ui.display_upcoming_birthdays(book.get_upcoming_birthdays())
-
+        handler = COMMANDS.get(command)
+        if handler:
+            handler(args, book, ui)
         else:
             ui.display_message("Invalid command.")
             ui.show_available_commands()